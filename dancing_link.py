@@ -1,3 +1,6 @@
+import mmap
+import os
+import tempfile
 import unittest
 
 class Column:
@@ -11,6 +14,7 @@ class Column:
         self.column = None
         self.size = None
         self.name = None
+        self.index = None
 
 
 class Data:
@@ -39,29 +43,87 @@ class Verifier:
         return True
     def verify_existence(self, solution_set, problem_matrix):
         """
-        Verify if the solution exists
+        Verify if the solution exists, i.e. the selected rows cover every column exactly once
         :param solution_set: the row indices of subsets of the solution
         :param problem_matrix: the problem matrix to be solved
         """
-        subset = []
-        total_ones = 0
+        return ExactCoverVerifier(problem_matrix).verify(solution_set)
+
+
+class ExactCoverVerifier:
+    """A verifier that checks solutions against an exact cover problem using bitsets of rows"""
+
+    def __init__(self, problem_matrix, secondary_columns=()):
+        """
+        initialization, the bitset of each row is built once so that each solution is verified in O(solution size)
+        :param problem_matrix: the problem matrix to be solved
+        :param secondary_columns: the indices of columns that shall be covered at most once
+        """
+        self.row_bitsets = []
+        for row in problem_matrix:
+            row_bitset = 0
+            for column_index, data in enumerate(row):
+                if data == 1:
+                    row_bitset |= 1 << column_index
+            self.row_bitsets.append(row_bitset)
+
+        # the bitset of columns that shall be covered exactly once
+        column_size = len(problem_matrix[0]) if problem_matrix else 0
+        self.primary_bitset = (1 << column_size) - 1
+        for column_index in secondary_columns:
+            self.primary_bitset &= ~(1 << column_index)
+
+    def verify(self, solution_set):
+        """
+        Verify if the rows cover each primary column exactly once and each secondary column at most once
+        :param solution_set: the row indices of subsets of the solution
+        """
+        row_bitsets = self.row_bitsets
+        row_size = len(row_bitsets)
+        covered_bitset = 0
         for row_number in solution_set:
-            subset.append(problem_matrix[row_number])
-        for row in subset:
-            total_ones += row.count(1)
-        if total_ones < len(problem_matrix[0]):
-            return False
-        else:
-            return True
+            # reject row indices out of the problem matrix instead of letting negative indices wrap around
+            if not 0 <= row_number < row_size:
+                return False
+            row_bitset = row_bitsets[row_number]
+            if covered_bitset & row_bitset:
+                return False
+            covered_bitset |= row_bitset
+        return covered_bitset & self.primary_bitset == self.primary_bitset
+
+    def verify_all(self, solutions):
+        """
+        Verify a stream of solutions
+        :param solutions: an iterable of solution sets
+        :return the number of solutions that failed the verification
+        """
+        verify = self.verify
+        failures = 0
+        for solution_set in solutions:
+            if not verify(solution_set):
+                failures += 1
+        return failures
 
 class DancingLinkSolver:
     """A implementation of algorithm X using dancing link as the data structure"""
 
-    def __init__(self, header):
+    def __init__(self, header, symmetries=None, canonicalize=False, progress_callback=None, metrics_path=None,
+                 progress_interval=100000, progress_levels=3, solution_sink=None):
         """
         initialize the dancing link solver with the header of dancing link
         :param header: the header of the dancing link
         :type header: Column
+        :param symmetries: all the symmetries of the problem other than the identity, each given as a row permutation
+                           that maps a row index to the row index of its symmetric image. Column permutations are not
+                           accepted. Only the symmetries that map the first chosen column onto itself prune the search,
+                           so a group without such symmetries, like the rotations of a board, brings no speedup.
+        :param canonicalize: record a solution only when it is its own canonical form, so that each class of
+                             symmetric solutions is recorded once without keeping the found solutions in memory
+        :param progress_callback: a function called with each progress snapshot
+        :param metrics_path: the path of a Prometheus text file rewritten with each progress snapshot
+        :param progress_interval: the number of searched nodes between two progress snapshots
+        :param progress_levels: the number of shallow backtracking levels used to estimate the explored fraction
+        :param solution_sink: the sink that receives every found solution, a SolutionCountSink by default
         """
 
         self.header = header
@@ -69,24 +131,74 @@ class DancingLinkSolver:
         # initialize a iterator for transversing dancing link in four directions
         self.iterator = DancingLinkIterator()
 
-        # initialize a dictionary to save solution rows
-        self.solution_dictionary = {}
+        # the symmetries are used to prune symmetric branches at the first backtracking level
+        self.symmetries = symmetries or []
+        self.canonicalize = canonicalize
+        self.verify_symmetries()
+
+        # the rows explored at the first backtracking level, which is None before the search chooses its first column
+        self.first_level_rows = None
+
+        # initialize a sink to save every found solution
+        if solution_sink is None:
+            solution_sink = SolutionCountSink()
+        self.solution_sink = solution_sink
+        self.solution_count = 0
+
+        # initialize a list to save the solution row of each backtracking level
+        self.solution_rows = []
+
+        # progress reporting is disabled by never reaching the node count of the next report
+        self.progress_callback = progress_callback
+        self.metrics_path = metrics_path
+        self.progress_interval = progress_interval
+        self.node_count = 0
+        if progress_callback is None and metrics_path is None:
+            self.next_progress_node_count = float('inf')
+
+            # no branch positions are tracked either
+            self.progress_levels = 0
+        else:
+            self.next_progress_node_count = progress_interval
+            self.progress_levels = progress_levels
+
+        # the [branch index, branch count] of the shallow backtracking levels
+        self.branch_positions = []
 
     def search(self, k=0):
         """
         A recursive procedure to search the solution that is invoked with k = 0
         :param k: the index of backtracking level
         """
+        self.node_count += 1
+        if self.node_count >= self.next_progress_node_count:
+            self.next_progress_node_count = self.node_count + self.progress_interval
+            self.report_progress(k, self.estimate_explored_fraction(k))
 
         # terminate and return when all column are covered
         if self.header.right is self.header:
+            self.record_solution(k)
             return
         selected_column = self.choose_column()
         self.cover_column(selected_column)
-        for r in self.iterator.down(selected_column):
 
-            # save the solution of current backtracking level to solution dictionary
-            self.solution_dictionary[str(k)] = r
+        # the rows explored at the first level, one for each class of rows that are symmetric to each other
+        if k == 0:
+            self.first_level_rows = self.find_first_level_rows(selected_column)
+
+        # extend the list of solution rows when the search reaches a new backtracking level
+        if k == len(self.solution_rows):
+            self.solution_rows.append(None)
+
+        # only the shallow levels track their branches, the deeper levels iterate the rows directly
+        if k == 0 or k < self.progress_levels:
+            branches = self.track_branches(k, selected_column)
+        else:
+            branches = self.iterator.down(selected_column)
+        for r in branches:
+
+            # save the solution of current backtracking level to solution rows
+            self.solution_rows[k] = r
 
             # cover all column that conflicts with the selected column
             for j in self.iterator.right(r):
@@ -96,15 +208,164 @@ class DancingLinkSolver:
             self.search(k + 1)
 
             # backtrack
-            r = self.solution_dictionary[str(k)]
+            r = self.solution_rows[k]
             selected_column = r.column
 
             # uncover columns
             for j in self.iterator.left(r):
                 self.uncover_column(j.column)
         self.uncover_column(selected_column)
+        if k == 0 and (self.progress_callback is not None or self.metrics_path is not None):
+            self.report_progress(0, 1.0)
         return
 
+    def track_branches(self, k, selected_column):
+        """
+        Iterate the rows of the selected column at a shallow level, tracking the branch position for estimating
+        the explored fraction and skipping the first level rows symmetric to an explored row
+        :param k: the index of backtracking level
+        :param selected_column: the reference of the selected column
+        """
+        branch_position = None
+        if k < self.progress_levels:
+            del self.branch_positions[k:]
+            branch_position = [0, selected_column.size]
+            self.branch_positions.append(branch_position)
+        for branch_index, r in enumerate(self.iterator.down(selected_column)):
+            if branch_position is not None:
+                branch_position[0] = branch_index
+
+            # skip the row when it is symmetric to an explored row, since its solutions are symmetric copies
+            if k == 0 and r.row not in self.first_level_rows:
+                continue
+            yield r
+
+    def estimate_explored_fraction(self, k):
+        """
+        Estimate the explored fraction of the search tree from the branch positions of the shallow levels above k
+        :param k: the index of backtracking level
+        :return the explored fraction between 0 and 1
+        """
+        explored_fraction = 0.0
+        branch_weight = 1.0
+        for branch_index, branch_count in self.branch_positions[:k]:
+            branch_weight /= branch_count
+            explored_fraction += branch_index * branch_weight
+        return explored_fraction
+
+    def progress_snapshot(self, k, explored_fraction):
+        """
+        Take a snapshot of the search progress
+        :param k: the index of current backtracking level
+        :param explored_fraction: the explored fraction of the search tree
+        :return a dictionary of the progress metrics
+        """
+        return {'nodes': self.node_count, 'solutions': self.solution_count, 'depth': k,
+                'explored_fraction': explored_fraction}
+
+    def report_progress(self, k, explored_fraction):
+        """
+        Send a progress snapshot to the progress callback and the metrics file
+        :param k: the index of current backtracking level
+        :param explored_fraction: the explored fraction of the search tree
+        """
+        snapshot = self.progress_snapshot(k, explored_fraction)
+        if self.progress_callback is not None:
+            self.progress_callback(snapshot)
+        if self.metrics_path is not None:
+            self.write_metrics(snapshot)
+
+    def write_metrics(self, snapshot):
+        """
+        Rewrite the metrics file in the Prometheus text format, replacing it at once so readers never see a partial file
+        :param snapshot: the dictionary of the progress metrics
+        """
+        lines = []
+        for key, value in snapshot.items():
+            # the node and solution counts only increase, so they are exported as counters
+            if key in ('nodes', 'solutions'):
+                lines.append('# TYPE dancing_link_%s_total counter\n' % key)
+                lines.append('dancing_link_%s_total %s\n' % (key, value))
+            else:
+                lines.append('# TYPE dancing_link_%s gauge\n' % key)
+                lines.append('dancing_link_%s %s\n' % (key, value))
+        temporary_path = self.metrics_path + '.tmp'
+        with open(temporary_path, 'w') as metrics_file:
+            metrics_file.writelines(lines)
+        os.replace(temporary_path, self.metrics_path)
+
+    def verify_symmetries(self):
+        """ raise exception when a symmetry is not a permutation covering every row of the dancing link"""
+        if not self.symmetries:
+            return
+        row_size = 0
+        for column in self.iterator.right(self.header):
+            for data_object in self.iterator.down(column):
+                row_size = max(row_size, data_object.row + 1)
+        for symmetry in self.symmetries:
+            if len(symmetry) < row_size or sorted(symmetry) != list(range(len(symmetry))):
+                raise Exception('INVALID SYMMETRY')
+
+    def find_column_symmetries(self, selected_column):
+        """
+        Find the symmetries that map the rows of the selected column onto themselves
+        :param selected_column: the reference of the selected column
+        :return the list of row permutations that fix the selected column
+        """
+        column_rows = set(data_object.row for data_object in self.iterator.down(selected_column))
+        column_symmetries = []
+        for symmetry in self.symmetries:
+            if set(symmetry[row] for row in column_rows) == column_rows:
+                column_symmetries.append(symmetry)
+        return column_symmetries
+
+    def find_first_level_rows(self, selected_column):
+        """
+        Find the rows of the selected column to be explored, skipping each row that a symmetry fixing the column
+        maps onto an earlier explored row
+        :param selected_column: the reference of the selected column
+        :return the set of row indices to be explored
+        """
+        column_symmetries = self.find_column_symmetries(selected_column)
+        first_level_rows = set()
+        for data_object in self.iterator.down(selected_column):
+            if not any(symmetry[data_object.row] in first_level_rows for symmetry in column_symmetries):
+                first_level_rows.add(data_object.row)
+        return first_level_rows
+
+    def record_solution(self, k):
+        """
+        Save the solution found at the backtracking level k
+        :param k: the number of rows in the solution
+        """
+        # the count sink ignores the solution, so the list of rows is only built when it is needed
+        solution = None
+        if self.canonicalize:
+            solution = sorted(data_object.row for data_object in self.solution_rows[:k])
+            if self.canonical_form(solution) != solution:
+                return
+        elif self.solution_sink.needs_solution:
+            solution = [data_object.row for data_object in self.solution_rows[:k]]
+        self.solution_count += 1
+        self.solution_sink.write(solution)
+
+    def canonical_form(self, solution):
+        """
+        The canonical form of a solution is the least sorted row list among its symmetric images.
+        Once the search has chosen its first column, only the images through an explored first level row are
+        compared, since the images in skipped branches are never found.
+        :param solution: the row indices of the solution
+        :return the sorted row indices of the canonical form
+        """
+        canonical_solution = sorted(solution)
+        for symmetry in self.symmetries:
+            symmetric_solution = sorted(symmetry[row] for row in solution)
+            if self.first_level_rows is not None and self.first_level_rows.isdisjoint(symmetric_solution):
+                continue
+            if symmetric_solution < canonical_solution:
+                canonical_solution = symmetric_solution
+        return canonical_solution
+
     def choose_column(self):
         """
         minimize the branching factor by choosing the column with the least size
@@ -173,6 +434,12 @@ class DancingLinkSolver:
         selected_column.right.left = selected_column
         selected_column.left.right = selected_column
 
+    @property
+    def solution_dictionary(self):
+        """ the solution rows keyed by the string of their backtracking level"""
+        return {str(level): data_object for level, data_object in enumerate(self.solution_rows)
+                if data_object is not None}
+
     def print_solution(self):
         """ print the solution"""
         for key, data_object in self.solution_dictionary.items():
@@ -184,6 +451,200 @@ class DancingLinkSolver:
             solution_list.append(data_object.row)
         return solution_list
 
+class SolutionSink:
+    """The interface of the sinks that receive the solutions found by the solver"""
+
+    # the solver passes None instead of the row indices to the sinks that do not need them
+    needs_solution = True
+
+    def write(self, solution):
+        """
+        Receive a solution
+        :param solution: the row indices of the solution, or None when the sink does not need them
+        """
+        raise NotImplementedError
+
+    def close(self):
+        """ release the resources of the sink"""
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SolutionCountSink(SolutionSink):
+    """A sink that only counts the solutions"""
+
+    needs_solution = False
+
+    def __init__(self):
+        self.solution_count = 0
+
+    def write(self, solution):
+        self.solution_count += 1
+
+
+class SolutionListSink(SolutionSink):
+    """A sink that keeps the solutions in a list"""
+
+    def __init__(self):
+        self.solutions = []
+
+    def write(self, solution):
+        self.solutions.append(solution)
+
+
+class PackedSolutionWriter(SolutionSink):
+    """
+    A sink that writes the solutions to a binary file as packed records of row indices.
+    The file starts with the magic bytes and the row index width, where width 0 stands for varint.
+    Each record is the number of rows followed by the row indices, all encoded with the row index width.
+    """
+
+    MAGIC = b'DLXS'
+    WIDTHS = (0, 1, 2, 4, 8)
+
+    def __init__(self, path, width=0, buffer_size=1 << 20):
+        """
+        initialization
+        :param path: the path of the output file
+        :param width: the number of bytes of each row index, or 0 for varint
+        :param buffer_size: the number of bytes buffered before writing them to the file
+        """
+        if width not in self.WIDTHS:
+            raise Exception('INVALID WIDTH')
+        self.width = width
+        self.buffer_size = buffer_size
+        self.buffer = bytearray()
+        self.output_file = open(path, 'wb')
+        self.output_file.write(self.MAGIC + bytes([width]))
+
+    def write(self, solution):
+        # encode the whole record first, so that a row index that cannot be encoded leaves no partial record
+        record = bytearray()
+        if self.width == 0:
+            self.append_varint(record, len(solution))
+            for row in solution:
+                self.append_varint(record, row)
+        else:
+            record += len(solution).to_bytes(self.width, 'little')
+            for row in solution:
+                record += row.to_bytes(self.width, 'little')
+        self.buffer += record
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def append_varint(self, record, value):
+        """
+        Append a non-negative integer to the record in 7 bits per byte, with the high bit marking continuation
+        :param record: the bytearray of the record
+        :param value: the integer to be appended
+        """
+        if value < 0:
+            raise OverflowError('can\'t convert negative int to varint')
+        while value >= 0x80:
+            record.append(value & 0x7f | 0x80)
+            value >>= 7
+        record.append(value)
+
+    def flush(self):
+        """ write the buffered bytes to the file"""
+        self.output_file.write(self.buffer)
+        self.buffer.clear()
+
+    def close(self):
+        if not self.output_file.closed:
+            self.flush()
+            self.output_file.close()
+
+
+class PackedSolutionReader:
+    """A reader that memory-maps a file written by PackedSolutionWriter and iterates its solutions"""
+
+    def __init__(self, path):
+        """
+        initialization
+        :param path: the path of the file to be read
+        """
+        with open(path, 'rb') as input_file:
+            # an empty file cannot be memory-mapped, it is left by a writer stopped before its first flush
+            if os.fstat(input_file.fileno()).st_size == 0:
+                raise Exception('TRUNCATED PACKED SOLUTION FILE')
+            self.data = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic_size = len(PackedSolutionWriter.MAGIC)
+        if not PackedSolutionWriter.MAGIC.startswith(self.data[:magic_size]):
+            self.data.close()
+            raise Exception('NOT A PACKED SOLUTION FILE')
+        if len(self.data) <= magic_size:
+            self.data.close()
+            raise Exception('TRUNCATED PACKED SOLUTION FILE')
+        self.width = self.data[magic_size]
+        if self.width not in PackedSolutionWriter.WIDTHS:
+            self.data.close()
+            raise Exception('INVALID WIDTH')
+        self.start = magic_size + 1
+
+    def __iter__(self):
+        data = self.data
+        position = self.start
+        end = len(data)
+        if self.width == 0:
+            while position < end:
+                row_size, position = self.read_varint(position)
+                solution = []
+                for _ in range(row_size):
+                    row, position = self.read_varint(position)
+                    solution.append(row)
+                yield solution
+        else:
+            width = self.width
+            while position < end:
+                if position + width > end:
+                    raise Exception('TRUNCATED PACKED SOLUTION FILE')
+                row_size = int.from_bytes(data[position:position + width], 'little')
+                position += width
+                if position + row_size * width > end:
+                    raise Exception('TRUNCATED PACKED SOLUTION FILE')
+                solution = []
+                for _ in range(row_size):
+                    solution.append(int.from_bytes(data[position:position + width], 'little'))
+                    position += width
+                yield solution
+
+    def read_varint(self, position):
+        """
+        Read a varint
+        :param position: the position of the first byte of the varint
+        :return the integer and the position after the varint
+        """
+        data = self.data
+        end = len(data)
+        value = 0
+        shift = 0
+        while True:
+            if position >= end:
+                raise Exception('TRUNCATED PACKED SOLUTION FILE')
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return value, position
+            shift += 7
+
+    def close(self):
+        """ unmap the file"""
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
 class DancingLinkIterator:
     """ A collection of iterator for dancing link"""
 
@@ -212,7 +673,72 @@ class DancingLinkIterator:
             current_object = current_object.right
 
 
-class DancingLinkConstructor:
+class DancingLinkLinker:
+    """ The linking operations shared by the classes that build the dancing link"""
+
+    def connect_up_down(self, down_object, up_object):
+        """
+        create double connection between up and down
+        :param down_object: The down object
+        :param up_object: The up object
+        """
+        down_object.up = up_object
+        up_object.down = down_object
+
+    def connect_left_right(self, left_object, right_object):
+        """
+        create double connection between left and right
+        :param: left_object: The left object
+        :param: right_object: The right object
+        """
+        left_object.right = right_object
+        right_object.left = left_object
+
+    def append_column_object(self, header, column_name, column_index):
+        """
+        Create an empty column object and link it at the rightmost of the column objects
+        :param header: the header of the dancing link
+        :param column_name: the header of the new column
+        :param column_index: the column index of the new column
+        :return the new column object
+        """
+        column_object = Column()
+        column_object.name = column_name
+        column_object.column = column_object
+        column_object.size = 0
+        column_object.index = column_index
+        self.connect_up_down(column_object, column_object)
+        self.connect_left_right(header.left, column_object)
+        self.connect_left_right(column_object, header)
+        return column_object
+
+    def link_row(self, row_index, column_objects):
+        """
+        Create the data objects of a row, inserting each of them between the tail data object and its column object
+        :param row_index: the row index of the row
+        :param column_objects: the column objects of the columns covered by the row, from left to right
+        :return the first data object of the row
+        """
+        first_in_row = None
+        previous_left_object = None
+        for column_object in column_objects:
+            data_object = Data()
+            data_object.row = row_index
+            data_object.column = column_object
+            self.connect_up_down(data_object, column_object.up)
+            self.connect_up_down(column_object, data_object)
+            column_object.size += 1
+
+            if first_in_row is None:
+                first_in_row = data_object
+            else:
+                self.connect_left_right(previous_left_object, data_object)
+            previous_left_object = data_object
+        self.connect_left_right(previous_left_object, first_in_row)
+        return first_in_row
+
+
+class DancingLinkConstructor(DancingLinkLinker):
     """ Constructing the dancing link"""
 
     def __init__(self, column_headers, problem_matrix):
@@ -228,6 +754,18 @@ class DancingLinkConstructor:
         # a auxiliary dictionary that saves the reference to the last data object of corresponding column
         self.column_tail_objects_dictionary = {}
 
+        # a auxiliary dictionary that saves the reference to the first data object of corresponding row
+        self.row_head_objects_dictionary = {}
+
+        # a auxiliary dictionary that saves the number of rows of each row size
+        self.row_size_counts = {}
+
+        # the row index assigned to the next inserted row
+        self.next_row_index = 0
+
+        # the column index assigned to the next inserted column
+        self.next_column_index = 0
+
     def construct(self):
         """
         Construct a dancing link
@@ -351,8 +889,11 @@ class DancingLinkConstructor:
                     track_last_data_object()
                     connect_previous_left_data_object()
                 column_index += 1
+            self.row_head_objects_dictionary[str(row_index)] = first_in_row
+            self.update_row_size_counts(row.count(1), 1)
             row_index += 1
             self.connect_left_right(tail_in_row, first_in_row)
+        self.next_row_index = row_index
 
         # update column sizes after all data objects were created
         self.update_column_sizes(column_sizes)
@@ -374,32 +915,217 @@ class DancingLinkConstructor:
             data_object.down = data_object.column
             data_object.column.up = data_object
 
-    def connect_up_down(self, down_object, up_object):
-        """
-        create double connection between up and down
-        :param down_object: The down object
-        :param up_object: The up object
-        """
-        down_object.up = up_object
-        up_object.down = down_object
-
-    def connect_left_right(self, left_object, right_object):
-        """
-        create double connection between left and right
-        :param: left_object: The left object
-        :param: right_object: The right object
-        """
-        left_object.right = right_object
-        right_object.left = left_object
-
     def construct_column_tail_objects_dictionary(self):
         """Construct a dictionary that records the reference of the tail object of the corresponding column. """
         current_column = self.header.right
         current_column_index = 0
         while current_column is not self.header:
             self.column_tail_objects_dictionary[str(current_column_index)] = current_column
+            current_column.index = current_column_index
             current_column_index += 1
             current_column = current_column.right
+        self.next_column_index = current_column_index
+
+    def update_row_size_counts(self, row_size, count):
+        """
+        Update the number of rows of a row size
+        :param row_size: the number of data objects in the rows
+        :param count: the number of rows added, or removed when negative
+        """
+        self.row_size_counts[row_size] = self.row_size_counts.get(row_size, 0) + count
+
+    def add_row(self, row):
+        """
+        Insert a row given by 1 and 0 into the constructed dancing link.
+        Scanning the row costs the number of columns, use add_row_by_column_indices for sparse rows.
+        :param row: the subset of column headers represented by 1 and 0, indexed like the problem matrix
+        :return the row index assigned to the inserted row
+        """
+        return self.add_row_by_column_indices([column_index for column_index, data in enumerate(row) if data == 1])
+
+    def add_row_by_column_indices(self, column_indices):
+        """
+        Insert a row into the constructed dancing link, linking each data object above its column object.
+        The cost is proportional to the length of the row rather than the size of the whole matrix.
+        :param column_indices: the distinct column indices of the columns covered by the row, from left to right
+        :return the row index assigned to the inserted row
+        """
+        # check the whole row before linking any data object, so that a rejected row leaves the dancing link intact
+        for column_index in column_indices:
+            if str(column_index) not in self.column_tail_objects_dictionary:
+                raise Exception('COLUMN NOT FOUND')
+        if not column_indices:
+            raise Exception('EMPTY ROW')
+        if len(set(column_indices)) != len(column_indices):
+            raise Exception('DUPLICATE COLUMN')
+        if len(column_indices) == len(self.column_tail_objects_dictionary):
+            raise Exception('NOT A PROPER SUBSET')
+
+        row_index = self.next_row_index
+        column_objects = [self.column_tail_objects_dictionary[str(column_index)].column
+                          for column_index in column_indices]
+        first_in_row = self.link_row(row_index, column_objects)
+
+        # the new data objects are the tail data objects of their columns
+        for column_index, column_object in zip(column_indices, column_objects):
+            self.column_tail_objects_dictionary[str(column_index)] = column_object.up
+        self.row_head_objects_dictionary[str(row_index)] = first_in_row
+        self.update_row_size_counts(len(column_indices), 1)
+        self.next_row_index += 1
+        return row_index
+
+    def remove_row(self, row_index):
+        """
+        Delete a row from the constructed dancing link by unlinking its data objects from their columns.
+        The row keeps its entry in the problem matrix so that the indices of other rows stay valid.
+        :param row_index: the row index of the row to be deleted
+        """
+        first_in_row = self.row_head_objects_dictionary.pop(str(row_index), None)
+        if first_in_row is None:
+            raise Exception('ROW NOT FOUND')
+        row_size = 0
+        data_object = first_in_row
+        while True:
+            self.unlink_data_object_from_column(data_object)
+            row_size += 1
+            data_object = data_object.right
+            if data_object is first_in_row:
+                break
+        self.update_row_size_counts(row_size, -1)
+
+    def add_column(self, column_name):
+        """
+        Append an empty column object at the rightmost of the column objects
+        :param column_name: the header of the new column
+        :return the column index assigned to the new column
+        """
+        column_index = self.next_column_index
+        column_object = self.append_column_object(self.header, column_name, column_index)
+        self.column_tail_objects_dictionary[str(column_index)] = column_object
+        self.next_column_index += 1
+        return column_index
+
+    def remove_column(self, column_index):
+        """
+        Delete a column from the constructed dancing link.
+        Its column object is unlinked from the header and its data objects are unlinked from their rows,
+        so the cost is proportional to the total length of the rows in the column.
+        The rows that only cover this column become empty and are deleted as well.
+        :param column_index: the column index of the column to be deleted
+        :return the list of row indices of the deleted rows
+        """
+        column_tail_object = self.column_tail_objects_dictionary.get(str(column_index))
+        if column_tail_object is None:
+            raise Exception('COLUMN NOT FOUND')
+        column_object = column_tail_object.column
+        iterator = DancingLinkIterator()
+
+        # the size of every row in the column, each row shrinks by one data object
+        row_sizes = []
+        for data_object in iterator.down(column_object):
+            row_sizes.append(sum(1 for _ in iterator.right(data_object)) + 1)
+
+        # raise exception when a row outside the column would cover every remaining column
+        full_row_size = len(self.column_tail_objects_dictionary) - 1
+        if full_row_size > 0 and self.row_size_counts.get(full_row_size, 0) > row_sizes.count(full_row_size):
+            raise Exception('NOT A PROPER SUBSET')
+
+        del self.column_tail_objects_dictionary[str(column_index)]
+        self.connect_left_right(column_object.left, column_object.right)
+        deleted_rows = []
+        for data_object, row_size in zip(iterator.down(column_object), row_sizes):
+            row_key = str(data_object.row)
+            self.update_row_size_counts(row_size, -1)
+            if data_object.right is data_object:
+                # the row becomes empty and is deleted as well
+                del self.row_head_objects_dictionary[row_key]
+                deleted_rows.append(data_object.row)
+                continue
+            self.update_row_size_counts(row_size - 1, 1)
+            if self.row_head_objects_dictionary[row_key] is data_object:
+                self.row_head_objects_dictionary[row_key] = data_object.right
+            self.connect_left_right(data_object.left, data_object.right)
+        return deleted_rows
+
+    def unlink_data_object_from_column(self, data_object):
+        """
+        Remove a data object from the up-down linked list of its column and update the column size
+        :param data_object: the data object to be unlinked
+        """
+        column_object = data_object.column
+        if column_object.up is data_object:
+            self.column_tail_objects_dictionary[str(column_object.index)] = data_object.up
+        self.connect_up_down(data_object.down, data_object.up)
+        column_object.size -= 1
+
+
+class DancingLinkProblemBuilder(DancingLinkLinker):
+    """ Building the dancing link of a problem whose columns and rows are given by names and labels"""
+
+    def __init__(self, column_headers):
+        """ initialization
+        :param column_headers: the headers of columns
+        """
+        self.column_headers = column_headers
+
+        # a auxiliary dictionary that saves the column index of each column header
+        self.column_index_dictionary = {}
+        for column_index, column_name in enumerate(column_headers):
+            if column_name in self.column_index_dictionary:
+                raise Exception('DUPLICATE COLUMN HEADER')
+            self.column_index_dictionary[column_name] = column_index
+
+        # the label and the column indices of each row, and a auxiliary dictionary that saves the row index of each label
+        self.row_labels = []
+        self.rows = []
+        self.row_index_dictionary = {}
+
+    def add_row(self, row_label, column_names):
+        """
+        Add a row covering the named columns
+        :param row_label: the label of the row
+        :param column_names: the headers of the columns covered by the row
+        :return the row index assigned to the row
+        """
+        if row_label in self.row_index_dictionary:
+            raise Exception('DUPLICATE ROW LABEL')
+        column_indices = []
+        for column_name in column_names:
+            if column_name not in self.column_index_dictionary:
+                raise Exception('COLUMN NOT FOUND')
+            column_indices.append(self.column_index_dictionary[column_name])
+        if not column_indices:
+            raise Exception('EMPTY ROW')
+        if len(set(column_indices)) == len(self.column_headers):
+            raise Exception('NOT A PROPER SUBSET')
+        row_index = len(self.rows)
+        self.row_labels.append(row_label)
+        self.rows.append(sorted(set(column_indices)))
+        self.row_index_dictionary[row_label] = row_index
+        return row_index
+
+    def build(self):
+        """
+        Build the dancing link from the added rows, looking up column objects by their indices
+        :return the header column object of the dancing link
+        """
+        header = Column()
+        self.connect_left_right(header, header)
+        column_objects = []
+        for column_index, column_name in enumerate(self.column_headers):
+            column_objects.append(self.append_column_object(header, column_name, column_index))
+        for row_index, column_indices in enumerate(self.rows):
+            self.link_row(row_index, [column_objects[column_index] for column_index in column_indices])
+        return header
+
+    def get_labels(self, solution):
+        """
+        Translate the row indices of a solution to row labels
+        :param solution: the row indices of the solution
+        :return the list of row labels
+        """
+        row_labels = self.row_labels
+        return [row_labels[row] for row in solution]
 
 
 class TestDancingLinkSolver(unittest.TestCase):
@@ -514,6 +1240,117 @@ class TestDancingLinkSolver(unittest.TestCase):
 
         self.assertEqual(self.solver.get_solution(),[1, 3, 0])
 
+    def setUp3(self):
+
+        """
+                the 2 x 2 board tiled by dominoes, with the cells numbered
+                0 1
+                2 3
+                matrix=
+                (1, 1, 0, 0),
+                (0, 0, 1, 1),
+                (1, 0, 1, 0),
+                (0, 1, 0, 1)]
+                The solutions shall be 0, 1 and 2, 3, which are symmetric to each other
+        """
+        self.column_headers = ['0', '1', '2', '3']
+        self.problem_matrix = [(1, 1, 0, 0), (0, 0, 1, 1), (1, 0, 1, 0), (0, 1, 0, 1)]
+
+        # the rotations and reflections of the board as row permutations
+        self.symmetries = [[3, 2, 0, 1], [1, 0, 3, 2], [2, 3, 1, 0], [2, 3, 0, 1], [0, 1, 3, 2], [1, 0, 2, 3],
+                           [3, 2, 1, 0]]
+        self.dl = DancingLinkConstructor(self.column_headers, self.problem_matrix)
+        self.dl.header = self.dl.construct()
+
+    def test_search_all_solutions(self):
+        self.setUp3()
+        self.solver = DancingLinkSolver(self.dl.header, solution_sink=SolutionListSink())
+        self.solver.search()
+        self.assertEqual(self.solver.solution_sink.solutions, [[0, 1], [2, 3]])
+
+    def test_search_symmetries(self):
+        self.setUp3()
+        self.solver = DancingLinkSolver(self.dl.header, symmetries=self.symmetries, solution_sink=SolutionListSink())
+        self.assertEqual(self.solver.find_column_symmetries(self.dl.header.right), [[2, 3, 0, 1]])
+        self.solver.search()
+        self.assertEqual(self.solver.solution_sink.solutions, [[0, 1]])
+
+    def test_search_invalid_symmetries(self):
+        self.setUp3()
+        for symmetry in ([3, 2, 0], [3, 2, 0, 0], [3, 2, 0, 4]):
+            with self.assertRaises(Exception) as ex:
+                DancingLinkSolver(self.dl.header, symmetries=[self.symmetries[0], symmetry])
+            self.assertEqual(str(ex.exception), 'INVALID SYMMETRY')
+
+    def test_search_canonicalize(self):
+        self.setUp3()
+        self.solver = DancingLinkSolver(self.dl.header, symmetries=self.symmetries, canonicalize=True,
+                                        solution_sink=SolutionListSink())
+        self.assertEqual(self.solver.canonical_form([2, 3]), [0, 1])
+        self.solver.search()
+        self.assertEqual(self.solver.solution_sink.solutions, [[0, 1]])
+
+    def test_search_canonicalize_without_pruning(self):
+        """The rotations fix no column, so both solutions are found and only the canonical one is recorded"""
+        self.setUp3()
+        self.solver = DancingLinkSolver(self.dl.header, symmetries=self.symmetries[:3], canonicalize=True,
+                                        solution_sink=SolutionListSink())
+        self.solver.search()
+        self.assertEqual(self.solver.first_level_rows, {0, 2})
+        self.assertEqual(self.solver.solution_count, 1)
+        self.assertEqual(self.solver.solution_sink.solutions, [[0, 1]])
+
+    def test_search_progress_callback(self):
+        self.setUp3()
+        snapshots = []
+        self.solver = DancingLinkSolver(self.dl.header, progress_callback=snapshots.append, progress_interval=1)
+        self.solver.search()
+        self.assertEqual(self.solver.node_count, 5)
+        self.assertEqual(len(snapshots), 6)
+        self.assertEqual([snapshot['depth'] for snapshot in snapshots], [0, 1, 2, 1, 2, 0])
+        self.assertEqual([snapshot['explored_fraction'] for snapshot in snapshots], [0, 0, 0, 0.5, 0.5, 1.0])
+        self.assertEqual(snapshots[-1], {'nodes': 5, 'solutions': 2, 'depth': 0, 'explored_fraction': 1.0})
+
+    def test_search_progress_disabled(self):
+        self.setUp3()
+        self.solver = DancingLinkSolver(self.dl.header)
+        self.solver.search()
+        self.assertEqual(self.solver.node_count, 5)
+        self.assertEqual(self.solver.next_progress_node_count, float('inf'))
+        self.assertEqual(self.solver.branch_positions, [])
+
+    def test_search_metrics_file(self):
+        self.setUp3()
+        with tempfile.TemporaryDirectory() as directory:
+            metrics_path = os.path.join(directory, 'dancing_link.prom')
+            self.solver = DancingLinkSolver(self.dl.header, metrics_path=metrics_path, progress_interval=2)
+            self.solver.search()
+            with open(metrics_path) as metrics_file:
+                metrics = metrics_file.read()
+            self.assertEqual(os.listdir(directory), ['dancing_link.prom'])
+        self.assertIn('# TYPE dancing_link_nodes_total counter\ndancing_link_nodes_total 5\n', metrics)
+        self.assertIn('# TYPE dancing_link_solutions_total counter\ndancing_link_solutions_total 2\n', metrics)
+        self.assertIn('# TYPE dancing_link_depth gauge\ndancing_link_depth 0\n', metrics)
+        self.assertIn('dancing_link_explored_fraction 1.0\n', metrics)
+
+    def test_search_default_solution_sink(self):
+        self.setUp3()
+        self.solver = DancingLinkSolver(self.dl.header)
+        self.solver.search()
+        self.assertIsInstance(self.solver.solution_sink, SolutionCountSink)
+        self.assertEqual(self.solver.solution_sink.solution_count, 2)
+
+    def test_search_packed_solution_writer(self):
+        self.setUp3()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'solutions.bin')
+            with PackedSolutionWriter(path) as writer:
+                self.solver = DancingLinkSolver(self.dl.header, solution_sink=writer)
+                self.solver.search()
+            with PackedSolutionReader(path) as reader:
+                self.assertEqual(list(reader), [[0, 1], [2, 3]])
+        self.assertEqual(self.solver.solution_count, 2)
+
     def test_row_up_iterator(self):
         """
         Test Iterator_up function
@@ -779,6 +1616,250 @@ class TestDancingLinkConstructor(unittest.TestCase):
         self.assertEqual(Data1, Data2.left)
 
 
+class TestDancingLinkProblemBuilder(unittest.TestCase):
+    """Test building dancing link from named columns and labelled rows"""
+
+    def setUp(self):
+        self.builder = DancingLinkProblemBuilder(['a', 'b', 'c', 'd', 'e', 'f'])
+        self.builder.add_row('B', ['b'])
+        self.builder.add_row('AD', ['d', 'a'])
+        self.builder.add_row('C', ['c'])
+        self.builder.add_row('EF', ['e', 'f'])
+        self.builder.add_row('AB', ['a', 'b'])
+        self.iterator = DancingLinkIterator()
+
+    def test_add_row(self):
+        self.assertEqual(self.builder.column_index_dictionary['d'], 3)
+        self.assertEqual(self.builder.row_index_dictionary['EF'], 3)
+        self.assertEqual(self.builder.rows[1], [0, 3])
+
+    def test_duplicate_column_header(self):
+        with self.assertRaises(Exception) as ex:
+            DancingLinkProblemBuilder(['a', 'b', 'a'])
+        self.assertEqual(str(ex.exception), 'DUPLICATE COLUMN HEADER')
+
+    def test_add_row_exception(self):
+        with self.assertRaises(Exception) as ex:
+            self.builder.add_row('B', ['c'])
+        self.assertEqual(str(ex.exception), 'DUPLICATE ROW LABEL')
+        with self.assertRaises(Exception) as ex:
+            self.builder.add_row('G', ['g'])
+        self.assertEqual(str(ex.exception), 'COLUMN NOT FOUND')
+        with self.assertRaises(Exception) as ex:
+            self.builder.add_row('ALL', ['a', 'b', 'c', 'd', 'e', 'f'])
+        self.assertEqual(str(ex.exception), 'NOT A PROPER SUBSET')
+
+    def test_build(self):
+        header = self.builder.build()
+        dl = DancingLinkConstructor(['a', 'b', 'c', 'd', 'e', 'f'],
+                                    [(0, 1, 0, 0, 0, 0), (1, 0, 0, 1, 0, 0), (0, 0, 1, 0, 0, 0), (0, 0, 0, 0, 1, 1),
+                                     (1, 1, 0, 0, 0, 0)])
+        expected_header = dl.construct()
+        for column, expected_column in zip(self.iterator.right(header), self.iterator.right(expected_header)):
+            self.assertEqual(column.name, expected_column.name)
+            self.assertEqual(column.size, expected_column.size)
+            self.assertEqual([data_object.row for data_object in self.iterator.down(column)],
+                             [data_object.row for data_object in self.iterator.down(expected_column)])
+            self.assertEqual([data_object.row for data_object in self.iterator.up(column)],
+                             [data_object.row for data_object in self.iterator.up(expected_column)])
+        self.assertEqual(header.left.name, 'f')
+
+    def test_get_labels(self):
+        solver = DancingLinkSolver(self.builder.build())
+        solver.search()
+        self.assertEqual(self.builder.get_labels(solver.get_solution()), ['C', 'AD', 'B', 'EF'])
+
+
+class TestDancingLinkUpdate(unittest.TestCase):
+    """Test incremental row and column updates on a constructed dancing link"""
+
+    def setUp(self):
+        self.column_headers = ['a', 'b', 'c', 'd', 'e', 'f']
+        self.problem_matrix = [(0, 1, 0, 0, 0, 0), (1, 0, 0, 1, 0, 0), (0, 0, 1, 0, 0, 0), (0, 0, 0, 0, 1, 1)]
+        self.dl = DancingLinkConstructor(self.column_headers, self.problem_matrix)
+        self.dl.header = self.dl.construct()
+        self.iterator = DancingLinkIterator()
+
+    def assert_links_consistent(self):
+        """Check the four link rings and the column sizes"""
+        for column in self.iterator.right(self.dl.header):
+            self.assertIs(column.right.left, column)
+            size = 0
+            for data_object in self.iterator.down(column):
+                self.assertIs(data_object.down.up, data_object)
+                self.assertIs(data_object.right.left, data_object)
+                self.assertIs(data_object.column, column)
+                size += 1
+            self.assertEqual(column.size, size)
+
+    def test_add_row(self):
+        row_index = self.dl.add_row((1, 1, 0, 0, 0, 0))
+        self.assertEqual(row_index, 4)
+        self.assertEqual(self.dl.column_tail_objects_dictionary['0'].column.size, 2)
+        self.assertEqual(self.dl.column_tail_objects_dictionary['0'].row, 4)
+        self.assert_links_consistent()
+        solver = DancingLinkSolver(self.dl.header)
+        solver.search()
+        self.assertEqual(solver.get_solution(), [2, 1, 0, 3])
+
+    def test_add_row_exception(self):
+        with self.assertRaises(Exception) as ex:
+            self.dl.add_row((1, 1, 1, 1, 1, 1))
+        self.assertEqual(str(ex.exception), 'NOT A PROPER SUBSET')
+        with self.assertRaises(Exception) as ex:
+            self.dl.add_row((0, 0, 0, 0, 0, 0))
+        self.assertEqual(str(ex.exception), 'EMPTY ROW')
+
+    def test_remove_row(self):
+        self.dl.add_row((1, 1, 0, 0, 0, 0))
+        self.dl.remove_row(4)
+        self.assertEqual(self.dl.column_tail_objects_dictionary['0'].row, 1)
+        self.dl.remove_row(2)
+        self.assertEqual(self.dl.column_tail_objects_dictionary['2'].column.size, 0)
+        self.assertIs(self.dl.column_tail_objects_dictionary['2'], self.dl.header.right.right.right)
+        self.assert_links_consistent()
+        with self.assertRaises(Exception) as ex:
+            self.dl.remove_row(2)
+        self.assertEqual(str(ex.exception), 'ROW NOT FOUND')
+
+    def test_add_row_with_removed_column(self):
+        self.dl.remove_column(3)
+        with self.assertRaises(Exception) as ex:
+            self.dl.add_row((1, 0, 0, 1, 0, 0))
+        self.assertEqual(str(ex.exception), 'COLUMN NOT FOUND')
+        self.assertEqual(self.dl.column_tail_objects_dictionary['0'].column.size, 1)
+        self.assertEqual(self.dl.next_row_index, 4)
+        self.assert_links_consistent()
+
+    def test_add_row_keeps_problem_matrix(self):
+        problem_matrix = tuple(self.problem_matrix)
+        self.dl = DancingLinkConstructor(self.column_headers, problem_matrix)
+        self.dl.header = self.dl.construct()
+        self.dl.add_row((1, 1, 0, 0, 0, 0))
+        self.dl.add_column('g')
+        self.assertIs(self.dl.problem_matrix, problem_matrix)
+        self.assertEqual(len(self.problem_matrix), 4)
+        self.assertEqual(self.column_headers, ['a', 'b', 'c', 'd', 'e', 'f'])
+
+    def test_add_row_by_column_indices(self):
+        self.assertEqual(self.dl.add_row_by_column_indices([0, 1]), 4)
+        self.assertEqual(self.dl.row_size_counts, {1: 2, 2: 3})
+        self.assert_links_consistent()
+        with self.assertRaises(Exception) as ex:
+            self.dl.add_row_by_column_indices([2, 2])
+        self.assertEqual(str(ex.exception), 'DUPLICATE COLUMN')
+
+    def test_remove_column_exception(self):
+        self.dl = DancingLinkConstructor(['a', 'b', 'c'], [(1, 1, 0), (0, 0, 1)])
+        self.dl.header = self.dl.construct()
+        with self.assertRaises(Exception) as ex:
+            self.dl.remove_column(2)
+        self.assertEqual(str(ex.exception), 'NOT A PROPER SUBSET')
+        self.assertEqual(self.dl.header.left.name, 'c')
+        self.assertEqual(self.dl.remove_column(0), [])
+        self.assertEqual(self.dl.row_size_counts, {1: 2, 2: 0})
+        self.assert_links_consistent()
+
+    def test_add_column(self):
+        column_index = self.dl.add_column('g')
+        self.assertEqual(column_index, 6)
+        self.assertEqual(self.dl.header.left.name, 'g')
+        self.assertEqual(self.dl.header.left.size, 0)
+        self.dl.add_row((0, 0, 0, 0, 0, 0, 1))
+        self.assertEqual(self.dl.header.left.size, 1)
+        self.assert_links_consistent()
+
+    def test_remove_column(self):
+        self.dl.remove_column(3)
+        self.assertEqual([column.name for column in self.iterator.right(self.dl.header)], ['a', 'b', 'c', 'e', 'f'])
+        self.assertIs(self.dl.row_head_objects_dictionary['1'].right, self.dl.row_head_objects_dictionary['1'])
+        self.assert_links_consistent()
+        self.assertEqual(self.dl.remove_column(2), [2])
+        self.assertNotIn('2', self.dl.row_head_objects_dictionary)
+        self.assertEqual(self.dl.row_size_counts, {1: 2, 2: 1})
+        with self.assertRaises(Exception) as ex:
+            self.dl.add_row((0, 0, 1, 0, 0, 0))
+        self.assertEqual(str(ex.exception), 'COLUMN NOT FOUND')
+
+
+class TestPackedSolution(unittest.TestCase):
+    """Test writing and reading packed solution files"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'solutions.bin')
+        self.solutions = [[0, 1, 127], [128, 300, 70000], [], [2 ** 31]]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_varint(self):
+        with PackedSolutionWriter(self.path, buffer_size=4) as writer:
+            for solution in self.solutions:
+                writer.write(solution)
+        with open(self.path, 'rb') as input_file:
+            self.assertEqual(input_file.read()[:11], b'DLXS\x00\x03\x00\x01\x7f\x03\x80')
+        with PackedSolutionReader(self.path) as reader:
+            self.assertEqual(list(reader), self.solutions)
+
+    def test_fixed_width(self):
+        with PackedSolutionWriter(self.path, width=4) as writer:
+            for solution in self.solutions:
+                writer.write(solution)
+        self.assertEqual(os.path.getsize(self.path), 5 + 4 * 11)
+        with PackedSolutionReader(self.path) as reader:
+            self.assertEqual(list(reader), self.solutions)
+
+    def test_unencodable_row(self):
+        with self.assertRaises(OverflowError):
+            with PackedSolutionWriter(self.path, width=1) as writer:
+                writer.write([1, 2])
+                writer.write([3, 300, 4])
+        with self.assertRaises(OverflowError):
+            with PackedSolutionWriter(self.path) as writer:
+                writer.write([1, 2])
+                writer.write([3, -1])
+        with PackedSolutionReader(self.path) as reader:
+            self.assertEqual(list(reader), [[1, 2]])
+
+    def test_truncated_file(self):
+        for width in (0, 4):
+            with PackedSolutionWriter(self.path, width=width) as writer:
+                writer.write([1, 300])
+            with open(self.path, 'rb') as input_file:
+                data = input_file.read()
+            for size in range(6, len(data)):
+                with open(self.path, 'wb') as output_file:
+                    output_file.write(data[:size])
+                with PackedSolutionReader(self.path) as reader:
+                    with self.assertRaises(Exception) as ex:
+                        list(reader)
+                self.assertEqual(str(ex.exception), 'TRUNCATED PACKED SOLUTION FILE')
+
+    def test_exception(self):
+        with self.assertRaises(Exception) as ex:
+            PackedSolutionWriter(self.path, width=3)
+        self.assertEqual(str(ex.exception), 'INVALID WIDTH')
+        with open(self.path, 'wb') as output_file:
+            output_file.write(b'NONE')
+        with self.assertRaises(Exception) as ex:
+            PackedSolutionReader(self.path)
+        self.assertEqual(str(ex.exception), 'NOT A PACKED SOLUTION FILE')
+        with open(self.path, 'wb') as output_file:
+            output_file.write(b'DLXS\x03')
+        with self.assertRaises(Exception) as ex:
+            PackedSolutionReader(self.path)
+        self.assertEqual(str(ex.exception), 'INVALID WIDTH')
+
+    def test_truncated_header(self):
+        for data in (b'', b'DL', b'DLXS'):
+            with open(self.path, 'wb') as output_file:
+                output_file.write(data)
+            with self.assertRaises(Exception) as ex:
+                PackedSolutionReader(self.path)
+            self.assertEqual(str(ex.exception), 'TRUNCATED PACKED SOLUTION FILE')
+
+
 class TestVerifier(unittest.TestCase):
 
     def setUp(self):
@@ -797,3 +1878,36 @@ class TestVerifier(unittest.TestCase):
 
     def test_verify_solution_existence_true(self):
         self.assertTrue(self.verifier.verify_existence([0, 1, 2,3], self.problem_matrix_of_existing_solution))
+
+    def test_verify_solution_existence_overlap(self):
+        self.assertFalse(self.verifier.verify_existence([0, 1, 2, 3, 4], self.problem_matrix_of_existing_solution))
+
+
+class TestExactCoverVerifier(unittest.TestCase):
+
+    def setUp(self):
+        self.problem_matrix = [(0, 1, 0, 0, 0, 0), (1, 0, 0, 1, 0, 0), (0, 0, 1, 0, 0, 0), (0, 0, 0, 0, 1, 1),
+                               (1, 1, 0, 0, 0, 0), (0, 0, 0, 0, 1, 0)]
+        self.verifier = ExactCoverVerifier(self.problem_matrix)
+
+    def test_row_bitsets(self):
+        self.assertEqual(self.verifier.row_bitsets[:2], [0b10, 0b1001])
+        self.assertEqual(self.verifier.primary_bitset, 0b111111)
+
+    def test_verify(self):
+        self.assertTrue(self.verifier.verify([2, 1, 0, 3]))
+        self.assertFalse(self.verifier.verify([2, 1, 0]))
+        self.assertFalse(self.verifier.verify([0, 1, 4, 2, 3]))
+
+    def test_verify_out_of_range_rows(self):
+        self.assertFalse(self.verifier.verify([0, -5, 2, 3]))
+        self.assertFalse(self.verifier.verify([0, 1, 2, 3, 6]))
+
+    def test_verify_secondary_columns(self):
+        verifier = ExactCoverVerifier(self.problem_matrix, secondary_columns=[5])
+        self.assertTrue(verifier.verify([0, 1, 2, 3]))
+        self.assertTrue(verifier.verify([0, 1, 2, 5]))
+        self.assertFalse(verifier.verify([0, 1, 2, 3, 5]))
+
+    def test_verify_all(self):
+        self.assertEqual(self.verifier.verify_all([[2, 1, 0, 3], [2, 1, 0], [0, 1, 2, 3]]), 1)